@@ -9,8 +9,11 @@ import abc
 import pathlib
 import sys
 import typing
+import weakref
 
 import mpi4py.MPI
+import numpy as np
+import numpy.typing
 import petsc4py.PETSc
 
 Function = typing.TypeVar("Function")
@@ -36,11 +39,18 @@ class FunctionsList(abc.ABC, typing.Generic[Function]):
         MPI communicator, derived from the finite element space provided as input.
     _list
         Internal storage.
+    _correlation_matrices
+        Correlation matrices of the stored functions, indexed by the inner product callable they were computed
+        with. They are only stored when the proper orthogonal decomposition is explicitly asked to reuse them,
+        and they are discarded when stored functions are replaced or removed.
     """
 
     def __init__(self: typing_extensions.Self, comm: mpi4py.MPI.Intracomm) -> None:
         self._comm: mpi4py.MPI.Intracomm = comm
         self._list: list[Function] = list()
+        self._correlation_matrices: weakref.WeakKeyDictionary[  # type: ignore[no-any-unimported]
+            typing.Callable[[Function], typing.Callable[[Function], petsc4py.PETSc.RealType]],
+            np.typing.NDArray[petsc4py.PETSc.ScalarType]] = weakref.WeakKeyDictionary()
 
     @property
     def comm(self: typing_extensions.Self) -> mpi4py.MPI.Intracomm:
@@ -85,6 +95,51 @@ class FunctionsList(abc.ABC, typing.Generic[Function]):
     def clear(self: typing_extensions.Self) -> None:
         """Clear the storage."""
         self._list = list()
+        self._correlation_matrices.clear()
+
+    def get_correlation_matrix(  # type: ignore[no-any-unimported]
+        self: typing_extensions.Self,
+        compute_inner_product: typing.Callable[[Function], typing.Callable[[Function], petsc4py.PETSc.RealType]]
+    ) -> typing.Optional[np.typing.NDArray[petsc4py.PETSc.ScalarType]]:
+        """
+        Get the correlation matrix of the stored functions computed with a given inner product.
+
+        Parameters
+        ----------
+        compute_inner_product
+            The inner product callable the correlation matrix was computed with.
+
+        Returns
+        -------
+        :
+            The stored correlation matrix, or None if no correlation matrix is stored for the provided callable.
+        """
+        try:
+            return self._correlation_matrices.get(compute_inner_product)
+        except TypeError:  # the callable does not support weak references, and cannot be used as a key
+            return None
+
+    def store_correlation_matrix(  # type: ignore[no-any-unimported]
+        self: typing_extensions.Self,
+        compute_inner_product: typing.Callable[[Function], typing.Callable[[Function], petsc4py.PETSc.RealType]],
+        correlation_matrix: np.typing.NDArray[petsc4py.PETSc.ScalarType]
+    ) -> None:
+        """
+        Store the correlation matrix of the stored functions computed with a given inner product.
+
+        The correlation matrix is not stored if the callable does not support weak references.
+
+        Parameters
+        ----------
+        compute_inner_product
+            The inner product callable the correlation matrix was computed with.
+        correlation_matrix
+            Correlation matrix of the stored functions.
+        """
+        try:
+            self._correlation_matrices[compute_inner_product] = correlation_matrix
+        except TypeError:  # the callable does not support weak references, and cannot be used as a key
+            pass
 
     def save(self: typing_extensions.Self, directory: pathlib.Path, filename: str) -> None:
         """
@@ -125,6 +180,7 @@ class FunctionsList(abc.ABC, typing.Generic[Function]):
             Name of the file where to import the list from.
         """
         assert len(self._list) == 0
+        self._correlation_matrices.clear()
         self._load(directory, filename)
 
     @abc.abstractmethod
@@ -228,6 +284,7 @@ class FunctionsList(abc.ABC, typing.Generic[Function]):
             Function to be stored.
         """
         self._list[key] = item
+        self._correlation_matrices.clear()
 
     def __iter__(self: typing_extensions.Self) -> typing.Iterator[Function]:
         """Return an iterator over the list."""
@@ -5,6 +5,8 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 """Internal backend to compute the proper orthogonal decomposition."""
 
+import abc
+import sys
 import typing
 
 import numpy as np
@@ -17,6 +19,11 @@ from rbnicsx._backends.online_tensors import create_online_matrix, create_online
 from rbnicsx._backends.tensors_list import TensorsList
 from rbnicsx._cpp import cpp_library
 
+if sys.version_info >= (3, 11):  # pragma: no cover
+    import typing as typing_extensions
+else:  # pragma: no cover
+    import typing_extensions
+
 real_zero = petsc4py.PETSc.RealType(0.0)
 
 
@@ -24,7 +31,8 @@ def proper_orthogonal_decomposition_functions(  # type: ignore[no-any-unimported
     functions_list: FunctionsList[Function],
     compute_inner_product: typing.Callable[[Function], typing.Callable[[Function], petsc4py.PETSc.RealType]],
     scale: typing.Callable[[Function, petsc4py.PETSc.RealType], None],
-    N: int = -1, tol: petsc4py.PETSc.RealType = real_zero, normalize: bool = True
+    N: int = -1, tol: petsc4py.PETSc.RealType = real_zero, normalize: bool = True,
+    reuse_correlation_matrix: bool = False
 ) -> tuple[
     np.typing.NDArray[petsc4py.PETSc.RealType], FunctionsList[Function], list[petsc4py.PETSc.Vec]
 ]:
@@ -46,6 +54,9 @@ def proper_orthogonal_decomposition_functions(  # type: ignore[no-any-unimported
         Tolerance on the retained energy. If not provided, it will be set to zero.
     normalize
         If true (default), the modes are scaled to unit norm.
+    reuse_correlation_matrix
+        If true, the correlation matrix is stored on the FunctionsList, as described in
+        rbnicsx.backends.proper_orthogonal_decomposition. If false (default), it is computed from scratch.
 
     Returns
     -------
@@ -58,7 +69,7 @@ def proper_orthogonal_decomposition_functions(  # type: ignore[no-any-unimported
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
     """
     eigenvalues, modes, eigenvectors = _solve_eigenvalue_problem(
-        functions_list, compute_inner_product, scale, N, tol, normalize)
+        functions_list, compute_inner_product, scale, N, tol, normalize, reuse_correlation_matrix)
     modes_wrapped = functions_list.duplicate()
     modes_wrapped.extend(modes)
     return eigenvalues, modes_wrapped, eigenvectors
@@ -71,7 +82,7 @@ def proper_orthogonal_decomposition_functions_block(  # type: ignore[no-any-unim
     scale: typing.Callable[[Function, petsc4py.PETSc.RealType], None],
     N: typing.Union[int, list[int]] = -1,
     tol: typing.Union[petsc4py.PETSc.RealType, list[petsc4py.PETSc.RealType]] = real_zero,
-    normalize: bool = True
+    normalize: bool = True, distribute_eigenvalue_problems: bool = False, reuse_correlation_matrix: bool = False
 ) -> tuple[
     list[np.typing.NDArray[petsc4py.PETSc.RealType]], list[FunctionsList[Function]],
     list[list[petsc4py.PETSc.Vec]]
@@ -101,6 +112,16 @@ def proper_orthogonal_decomposition_functions_block(  # type: ignore[no-any-unim
         If not provided, it will be set to zero.
     normalize
         If true (default), the modes are scaled to unit norm.
+    distribute_eigenvalue_problems
+        If true, the eigenvalue problem of each block is solved by a single process of the communicator
+        of the corresponding FunctionsList, and its solution is then broadcast to the other processes.
+        This requires every process to assemble the same correlation matrices, as is the case when
+        the snapshots are distributed among processes. An exception raised while solving is broadcast
+        as well, and raised on every process. If false (default), every process solves all
+        eigenvalue problems on its own.
+    reuse_correlation_matrix
+        If true, the correlation matrix of each block is stored on the corresponding FunctionsList, as described in
+        rbnicsx.backends.proper_orthogonal_decomposition. If false (default), they are computed from scratch.
 
     Returns
     -------
@@ -120,15 +141,57 @@ def proper_orthogonal_decomposition_functions_block(  # type: ignore[no-any-unim
         assert len(N) == len(functions_lists)
     else:
         N = [N for _ in functions_lists]
+    # Check N on every process, since each eigenvalue problem may be solved by a single process
+    assert all(N_ > 0 or N_ == -1 for N_ in N)
     if isinstance(tol, list):
         assert len(tol) == len(functions_lists)
     else:
         tol = [tol for _ in functions_lists]
 
+    correlation_matrices = [
+        _assemble_correlation_matrix(functions_list, compute_inner_product, reuse_correlation_matrix)
+        for (functions_list, compute_inner_product) in zip(functions_lists, compute_inner_products)]
+
+    solutions = list()
+    if distribute_eigenvalue_problems:
+        # Solve the eigenvalue problem of each block on a single process, assigning blocks to processes in a
+        # round-robin fashion, so that eigenvalue problems of different blocks are solved concurrently
+        roots = [b % functions_list.comm.size for (b, functions_list) in enumerate(functions_lists)]
+        local_solutions: dict[int, typing.Union[  # type: ignore[no-any-unimported]
+            tuple[np.typing.NDArray[petsc4py.PETSc.RealType], list[np.typing.NDArray[petsc4py.PETSc.ScalarType]]],
+            Exception]] = dict()
+        for (b, (functions_list, correlation_matrix, N_, tol_)) in enumerate(zip(
+                functions_lists, correlation_matrices, N, tol)):
+            if functions_list.comm.rank == roots[b]:
+                try:
+                    local_eigenvalues, local_eigenvectors = _solve_correlation_eigenvalue_problem(
+                        correlation_matrix, N_, tol_)
+                except Exception as e:  # broadcast the error, rather than leaving other processes in bcast
+                    local_solutions[b] = e
+                else:
+                    local_solutions[b] = (
+                        local_eigenvalues, [eigenvector.array.copy() for eigenvector in local_eigenvectors])
+        for (b, (functions_list, correlation_matrix)) in enumerate(zip(functions_lists, correlation_matrices)):
+            solution = functions_list.comm.bcast(local_solutions.get(b), root=roots[b])
+            if isinstance(solution, Exception):
+                raise solution
+            eigenvalues_, eigenvectors_arrays = solution
+            eigenvectors_ = list()
+            for eigenvector_array in eigenvectors_arrays:
+                eigenvector = create_online_vector(correlation_matrix.size[0])
+                eigenvector[:] = eigenvector_array
+                eigenvectors_.append(eigenvector)
+            solutions.append((eigenvalues_, eigenvectors_))
+    else:
+        for (correlation_matrix, N_, tol_) in zip(correlation_matrices, N, tol):
+            solutions.append(_solve_correlation_eigenvalue_problem(correlation_matrix, N_, tol_))
+
     eigenvalues, modes, eigenvectors = list(), list(), list()
-    for (functions_list, compute_inner_product, N_, tol_) in zip(functions_lists, compute_inner_products, N, tol):
-        eigenvalues_, modes_, eigenvectors_ = proper_orthogonal_decomposition_functions(
-            functions_list, compute_inner_product, scale, N_, tol_, normalize)
+    for (functions_list, compute_inner_product, (eigenvalues_, eigenvectors_)) in zip(
+            functions_lists, compute_inner_products, solutions):
+        modes_ = functions_list.duplicate()
+        modes_.extend(
+            _compute_modes(functions_list, compute_inner_product, scale, eigenvalues_, eigenvectors_, normalize))
         eigenvalues.append(eigenvalues_)
         modes.append(modes_)
         eigenvectors.append(eigenvectors_)
@@ -165,41 +228,63 @@ def proper_orthogonal_decomposition_tensors(  # type: ignore[no-any-unimported]
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
     """
     assert tensors_list.type in ("Mat", "Vec")
+    compute_inner_product: typing.Union[  # type: ignore[no-any-unimported]
+        typing.Callable[[petsc4py.PETSc.Mat], typing.Callable[[petsc4py.PETSc.Mat], petsc4py.PETSc.RealType]],
+        typing.Callable[[petsc4py.PETSc.Vec], typing.Callable[[petsc4py.PETSc.Vec], petsc4py.PETSc.RealType]]
+    ]
+    scale: typing.Union[  # type: ignore[no-any-unimported]
+        typing.Callable[[petsc4py.PETSc.Mat, petsc4py.PETSc.RealType], None],
+        typing.Callable[[petsc4py.PETSc.Vec, petsc4py.PETSc.RealType], None]
+    ]
     if tensors_list.type == "Mat":
-        def compute_inner_product(  # type: ignore[no-any-unimported]
-            tensor_j: petsc4py.PETSc.Mat
-        ) -> typing.Callable[[petsc4py.PETSc.Mat], petsc4py.PETSc.RealType]:
-            def _(tensor_i: petsc4py.PETSc.Mat) -> petsc4py.PETSc.RealType:  # type: ignore[no-any-unimported]
-                return cpp_library._backends.frobenius_inner_product(tensor_i, tensor_j)
-
-            return _
-
-        def scale(  # type: ignore[no-any-unimported]
-            tensor: petsc4py.PETSc.Mat, factor: petsc4py.PETSc.RealType
-        ) -> None:
-            tensor *= factor
+        compute_inner_product = _frobenius_inner_product
+        scale = _scale_matrix
     elif tensors_list.type == "Vec":
-        def compute_inner_product(  # type: ignore[no-any-unimported]
-            tensor_j: petsc4py.PETSc.Vec
-        ) -> typing.Callable[[petsc4py.PETSc.Vec], petsc4py.PETSc.RealType]:
-            def _(tensor_i: petsc4py.PETSc.Vec) -> petsc4py.PETSc.RealType:  # type: ignore[no-any-unimported]
-                return tensor_i.dot(tensor_j)
-
-            return _
-
-        def scale(  # type: ignore[no-any-unimported]
-            tensor: petsc4py.PETSc.Vec, factor: petsc4py.PETSc.RealType
-        ) -> None:
-            with tensor.localForm() as tensor_local:
-                tensor_local *= factor
+        compute_inner_product = _euclidean_inner_product
+        scale = _scale_vector
 
     eigenvalues, modes, eigenvectors = _solve_eigenvalue_problem(
-        tensors_list, compute_inner_product, scale, N, tol, normalize)
+        tensors_list, compute_inner_product, scale, N, tol, normalize, False)
     modes_wrapped = tensors_list.duplicate()
     modes_wrapped.extend(modes)
     return eigenvalues, modes_wrapped, eigenvectors
 
 
+def _frobenius_inner_product(  # type: ignore[no-any-unimported]
+    tensor_j: petsc4py.PETSc.Mat
+) -> typing.Callable[[petsc4py.PETSc.Mat], petsc4py.PETSc.RealType]:
+    """Compute the Frobenius inner product between two matrices."""
+    def _(tensor_i: petsc4py.PETSc.Mat) -> petsc4py.PETSc.RealType:  # type: ignore[no-any-unimported]
+        return cpp_library._backends.frobenius_inner_product(tensor_i, tensor_j)
+
+    return _
+
+
+def _euclidean_inner_product(  # type: ignore[no-any-unimported]
+    tensor_j: petsc4py.PETSc.Vec
+) -> typing.Callable[[petsc4py.PETSc.Vec], petsc4py.PETSc.RealType]:
+    """Compute the Euclidean inner product between two vectors."""
+    def _(tensor_i: petsc4py.PETSc.Vec) -> petsc4py.PETSc.RealType:  # type: ignore[no-any-unimported]
+        return tensor_i.dot(tensor_j)
+
+    return _
+
+
+def _scale_matrix(  # type: ignore[no-any-unimported]
+    tensor: petsc4py.PETSc.Mat, factor: petsc4py.PETSc.RealType
+) -> None:
+    """Scale a matrix."""
+    tensor *= factor
+
+
+def _scale_vector(  # type: ignore[no-any-unimported]
+    tensor: petsc4py.PETSc.Vec, factor: petsc4py.PETSc.RealType
+) -> None:
+    """Scale a vector."""
+    with tensor.localForm() as tensor_local:
+        tensor_local *= factor
+
+
 def _solve_eigenvalue_problem(  # type: ignore[no-any-unimported]
     snapshots: typing.Union[FunctionsList[Function], TensorsList],
     compute_inner_product: typing.Union[
@@ -212,7 +297,7 @@ def _solve_eigenvalue_problem(  # type: ignore[no-any-unimported]
         typing.Callable[[petsc4py.PETSc.Mat, petsc4py.PETSc.RealType], None],
         typing.Callable[[petsc4py.PETSc.Vec, petsc4py.PETSc.RealType], None],
     ],
-    N: int, tol: petsc4py.PETSc.RealType, normalize: bool
+    N: int, tol: petsc4py.PETSc.RealType, normalize: bool, reuse_correlation_matrix: bool
 ) -> tuple[
     np.typing.NDArray[petsc4py.PETSc.RealType],
     typing.Union[
@@ -236,6 +321,8 @@ def _solve_eigenvalue_problem(  # type: ignore[no-any-unimported]
         Tolerance on the retained energy.
     normalize
         If true (default), the modes are scaled to unit norm.
+    reuse_correlation_matrix
+        If true, reuse and update the correlation matrix stored on the snapshots object.
 
     Returns
     -------
@@ -247,16 +334,93 @@ def _solve_eigenvalue_problem(  # type: ignore[no-any-unimported]
             3. Eigenvectors of the correlation matrix. Only the first few eigenvectors are returned, till
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
     """
-    assert N > 0 or N == -1
-    if N == -1:
-        N = len(snapshots)
+    correlation_matrix = _assemble_correlation_matrix(snapshots, compute_inner_product, reuse_correlation_matrix)
+    eigenvalues, eigenvectors = _solve_correlation_eigenvalue_problem(correlation_matrix, N, tol)
+    modes = _compute_modes(snapshots, compute_inner_product, scale, eigenvalues, eigenvectors, normalize)
+    return eigenvalues, modes, eigenvectors
+
+
+def _assemble_correlation_matrix(  # type: ignore[no-any-unimported]
+    snapshots: typing.Union[FunctionsList[Function], TensorsList],
+    compute_inner_product: typing.Union[
+        typing.Callable[[Function], typing.Callable[[Function], petsc4py.PETSc.RealType]],
+        typing.Callable[[petsc4py.PETSc.Mat], typing.Callable[[petsc4py.PETSc.Mat], petsc4py.PETSc.RealType]],
+        typing.Callable[[petsc4py.PETSc.Vec], typing.Callable[[petsc4py.PETSc.Vec], petsc4py.PETSc.RealType]]
+    ],
+    reuse_correlation_matrix: bool
+) -> petsc4py.PETSc.Mat:
+    """
+    Assemble the correlation matrix of a set of snapshots.
+
+    Parameters
+    ----------
+    snapshots
+        Collected snapshots.
+    compute_inner_product
+        A function that computes the inner product between two snapshots.
+        The inner product is assumed to be hermitian, so that only the upper triangular part of the matrix
+        is actually computed.
+    reuse_correlation_matrix
+        If true, the entries computed by a previous call with the same callable are read from the snapshots
+        object, which must be a FunctionsList, and only the entries involving snapshots appended in the meantime
+        are computed. The updated entries are then stored on the snapshots object for later calls.
+
+    Returns
+    -------
+    :
+        Online matrix storing the inner products between every pair of snapshots.
+    """
+    previous_values = None
+    if reuse_correlation_matrix:
+        assert isinstance(snapshots, FunctionsList)
+        previous_values = snapshots.get_correlation_matrix(compute_inner_product)
+    if previous_values is None:
+        previous_values = np.zeros((0, 0), dtype=petsc4py.PETSc.ScalarType)
+    values = np.zeros((len(snapshots), len(snapshots)), dtype=petsc4py.PETSc.ScalarType)
+    values[:previous_values.shape[0], :previous_values.shape[1]] = previous_values
+    for j in range(previous_values.shape[0], len(snapshots)):
+        compute_inner_product_partial_j = compute_inner_product(snapshots[j])
+        for i in range(j):
+            values[i, j] = compute_inner_product_partial_j(snapshots[i])
+            values[j, i] = np.conj(values[i, j])
+        values[j, j] = np.real(compute_inner_product_partial_j(snapshots[j]))
+    if reuse_correlation_matrix:
+        assert isinstance(snapshots, FunctionsList)
+        snapshots.store_correlation_matrix(compute_inner_product, values)
 
     correlation_matrix = create_online_matrix(len(snapshots), len(snapshots))
-    for (j, snapshot_j) in enumerate(snapshots):
-        compute_inner_product_partial_j = compute_inner_product(snapshot_j)
-        for (i, snapshot_i) in enumerate(snapshots):
-            correlation_matrix[i, j] = compute_inner_product_partial_j(snapshot_i)
+    indices = np.arange(len(snapshots), dtype=petsc4py.PETSc.IntType)
+    correlation_matrix.setValues(indices, indices, values)
     correlation_matrix.assemble()
+    return correlation_matrix
+
+
+def _solve_correlation_eigenvalue_problem(  # type: ignore[no-any-unimported]
+    correlation_matrix: petsc4py.PETSc.Mat, N: int, tol: petsc4py.PETSc.RealType
+) -> tuple[np.typing.NDArray[petsc4py.PETSc.RealType], list[petsc4py.PETSc.Vec]]:
+    """
+    Solve the eigenvalue problem for the correlation matrix.
+
+    Parameters
+    ----------
+    correlation_matrix
+        Online matrix storing the inner products between every pair of snapshots.
+    N
+        Maximum number of eigenvectors to be returned.
+    tol
+        Tolerance on the retained energy.
+
+    Returns
+    -------
+    :
+        A tuple containing:
+            1. Eigenvalues of the correlation matrix, largest first. All computed eigenvalues are returned.
+            2. Eigenvectors of the correlation matrix. Only the first few eigenvectors are returned, till
+               either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
+    """
+    assert N > 0 or N == -1
+    if N == -1:
+        N = correlation_matrix.size[0]
 
     eps = slepc4py.SLEPc.EPS().create(correlation_matrix.comm)
     eps.setType(slepc4py.SLEPc.EPS.Type.LAPACK)
@@ -288,13 +452,293 @@ def _solve_eigenvalue_problem(  # type: ignore[no-any-unimported]
         if tol > 0.0 and retained_energy[n] > 1.0 - tol:
             break
 
+    return np.array(eigenvalues), eigenvectors
+
+
+def _compute_modes(  # type: ignore[no-any-unimported]
+    snapshots: typing.Union[FunctionsList[Function], TensorsList],
+    compute_inner_product: typing.Union[
+        typing.Callable[[Function], typing.Callable[[Function], petsc4py.PETSc.RealType]],
+        typing.Callable[[petsc4py.PETSc.Mat], typing.Callable[[petsc4py.PETSc.Mat], petsc4py.PETSc.RealType]],
+        typing.Callable[[petsc4py.PETSc.Vec], typing.Callable[[petsc4py.PETSc.Vec], petsc4py.PETSc.RealType]]
+    ],
+    scale: typing.Union[
+        typing.Callable[[Function, petsc4py.PETSc.RealType], None],
+        typing.Callable[[petsc4py.PETSc.Mat, petsc4py.PETSc.RealType], None],
+        typing.Callable[[petsc4py.PETSc.Vec, petsc4py.PETSc.RealType], None],
+    ],
+    eigenvalues: np.typing.NDArray[petsc4py.PETSc.RealType], eigenvectors: list[petsc4py.PETSc.Vec], normalize: bool
+) -> typing.Union[list[Function], list[petsc4py.PETSc.Mat], list[petsc4py.PETSc.Vec]]:
+    """
+    Compute the modes associated to the eigenvectors of the correlation matrix.
+
+    Parameters
+    ----------
+    snapshots
+        Collected snapshots.
+    compute_inner_product
+        A function that computes the inner product between two snapshots.
+    scale
+        A function that rescales a snapshot in place.
+    eigenvalues
+        Eigenvalues of the correlation matrix, largest first.
+    eigenvectors
+        Eigenvectors of the correlation matrix, with unit norm.
+    normalize
+        If true, the modes are scaled to unit norm.
+
+    Returns
+    -------
+    :
+        Modes obtained by linearly combining the snapshots with the coefficients stored in each eigenvector.
+    """
+    # The squared norm of a mode is equal to the eigenvalue, since the eigenvector has unit norm, but only up to
+    # an absolute error proportional to the largest eigenvalue. Eigenvalues below this threshold, relative to
+    # the largest one, are deemed too inaccurate to normalize the corresponding mode
+    if len(eigenvalues) > 0:
+        eigenvalue_threshold = max(np.sqrt(np.finfo(petsc4py.PETSc.RealType).eps) * eigenvalues[0], 0.0)
+    else:
+        eigenvalue_threshold = 0.0
+
     modes = list()
-    for eigenvector_n in eigenvectors:
-        mode_n = snapshots * eigenvector_n
-        if normalize:
-            norm_n = np.sqrt(compute_inner_product(mode_n)(mode_n))
+    for (eigenvalue_n, eigenvector_n) in zip(eigenvalues, eigenvectors):
+        if normalize and eigenvalue_n > eigenvalue_threshold:
+            # Scale the coefficients rather than the mode, so that no further pass over the mode is required
+            coefficients_n = eigenvector_n.copy()
+            coefficients_n.scale(1.0 / np.sqrt(eigenvalue_n))
+            modes.append(snapshots * coefficients_n)
+        elif normalize:
+            # Measure the norm of the mode, and scale it in place
+            mode_n = snapshots * eigenvector_n
+            norm_n = np.sqrt(abs(compute_inner_product(mode_n)(mode_n)))
             if norm_n != 0.0:
                 scale(mode_n, 1.0 / norm_n)
-        modes.append(mode_n)
+            modes.append(mode_n)
+        else:
+            modes.append(snapshots * eigenvector_n)
+    return modes
+
+
+class IncrementalProperOrthogonalDecomposition(abc.ABC, typing.Generic[Function]):
+    """
+    A class to compute the proper orthogonal decomposition of snapshots which are collected one at a time.
+
+    The decomposition is updated with each new snapshot by an incremental singular value decomposition,
+    so that neither the snapshots nor their correlation matrix need to be stored.
+
+    Parameters
+    ----------
+    functions_list
+        An empty FunctionsList, which will be used to store the orthonormal basis of the decomposition.
+        Its content is replaced after each update.
+    compute_inner_product
+        A callable x(u)(v) to compute the action of the inner product on the trial function u and test function v.
+        The resulting modes will be orthonormal w.r.t. this inner product.
+    N
+        Maximum number of modes to be retained after each update. If not provided, the number of modes
+        will only be limited by the number of linearly independent snapshots.
+    tol
+        Tolerance on the retained energy. If not provided, it will be set to zero.
+
+    Attributes
+    ----------
+    _basis
+        Orthonormal basis of the retained modes.
+    _compute_inner_product
+        Callable provided as input.
+    _N
+        Maximum number of modes provided as input.
+    _tol
+        Tolerance on the retained energy provided as input.
+    _singular_values
+        Singular values associated to the retained modes, largest first.
+    _right_singular_vectors
+        Right singular vectors associated to the retained modes, stored by columns.
+        The i-th row corresponds to the i-th snapshot.
+    _total_energy
+        Sum of the squared norms of the snapshots collected so far.
+    """
 
-    return np.array(eigenvalues), modes, eigenvectors
+    def __init__(  # type: ignore[no-any-unimported]
+        self: typing_extensions.Self, functions_list: FunctionsList[Function],
+        compute_inner_product: typing.Callable[[Function], typing.Callable[[Function], petsc4py.PETSc.RealType]],
+        N: int = -1, tol: petsc4py.PETSc.RealType = real_zero
+    ) -> None:
+        assert len(functions_list) == 0
+        assert N > 0 or N == -1
+        self._basis: FunctionsList[Function] = functions_list
+        self._compute_inner_product: typing.Callable[  # type: ignore[no-any-unimported]
+            [Function], typing.Callable[[Function], petsc4py.PETSc.RealType]] = compute_inner_product
+        self._N: int = N
+        self._tol: petsc4py.PETSc.RealType = tol  # type: ignore[no-any-unimported]
+        self._singular_values: np.typing.NDArray[petsc4py.PETSc.RealType] = np.zeros(  # type: ignore[no-any-unimported]
+            0, dtype=petsc4py.PETSc.RealType)
+        self._right_singular_vectors: np.typing.NDArray[  # type: ignore[no-any-unimported]
+            petsc4py.PETSc.ScalarType] = np.zeros((0, 0), dtype=petsc4py.PETSc.ScalarType)
+        self._total_energy: petsc4py.PETSc.RealType = real_zero  # type: ignore[no-any-unimported]
+
+    def __len__(self: typing_extensions.Self) -> int:
+        """Return the number of snapshots collected so far."""
+        return self._right_singular_vectors.shape[0]  # type: ignore[no-any-return]
+
+    def append(self: typing_extensions.Self, snapshot: Function) -> None:
+        """
+        Update the decomposition with a new snapshot.
+
+        Parameters
+        ----------
+        snapshot
+            Snapshot to be added to the decomposition.
+        """
+        rank = len(self._basis)
+
+        compute_inner_product_residual = self._compute_inner_product(snapshot)
+        snapshot_energy = abs(compute_inner_product_residual(snapshot))
+        self._total_energy += snapshot_energy
+
+        # Project the snapshot on the current basis by classical Gram-Schmidt with reorthogonalization
+        projection = np.zeros(rank, dtype=petsc4py.PETSc.ScalarType)
+        residual = snapshot
+        if rank > 0:
+            for _ in range(2):
+                projection_correction = np.array(
+                    [compute_inner_product_residual(basis_function) for basis_function in self._basis],
+                    dtype=petsc4py.PETSc.ScalarType)
+                projection += projection_correction
+                extended_basis = self._basis.duplicate()
+                extended_basis.extend(self._basis)
+                extended_basis.append(residual)
+                residual_coefficients = create_online_vector(rank + 1)
+                residual_coefficients[:] = np.concatenate((- projection_correction, [1.0]))
+                residual = extended_basis * residual_coefficients
+                compute_inner_product_residual = self._compute_inner_product(residual)
+        residual_norm = np.sqrt(abs(compute_inner_product_residual(residual)))
+
+        # Assemble the small matrix whose singular value decomposition updates the current one. The orthogonal
+        # component is discarded when it is negligible, i.e. when the snapshot is already in the span of the basis
+        extended_basis = self._basis.duplicate()
+        extended_basis.extend(self._basis)
+        if residual_norm > np.sqrt(np.finfo(petsc4py.PETSc.RealType).eps * snapshot_energy):
+            extended_basis.append(residual)
+            update_matrix = np.zeros((rank + 1, rank + 1), dtype=petsc4py.PETSc.ScalarType)
+            update_matrix[rank, rank] = residual_norm
+        else:
+            update_matrix = np.zeros((rank, rank + 1), dtype=petsc4py.PETSc.ScalarType)
+        update_matrix[:rank, :rank] = np.diag(self._singular_values)
+        update_matrix[:rank, rank] = projection
+        if update_matrix.shape[0] > 0:
+            left_singular_vectors, singular_values, right_singular_vectors_h = np.linalg.svd(update_matrix)
+        else:  # trivial case, all snapshots collected so far are zero
+            left_singular_vectors = np.zeros((0, 0), dtype=petsc4py.PETSc.ScalarType)
+            singular_values = np.zeros(0, dtype=petsc4py.PETSc.RealType)
+            right_singular_vectors_h = np.ones((1, 1), dtype=petsc4py.PETSc.ScalarType)
+        if len(extended_basis) > rank:
+            # The orthogonal component has not been normalized: account for its norm in the coefficients
+            left_singular_vectors[rank, :] /= residual_norm
+
+        # Truncate the updated decomposition
+        new_rank = len(singular_values)
+        if self._N > 0:
+            new_rank = min(new_rank, self._N)
+        if self._tol > 0.0 and self._total_energy > 0.0:
+            retained_energy = np.cumsum(singular_values**2) / self._total_energy
+            tolerance_fulfilled = np.flatnonzero(retained_energy > 1.0 - self._tol)
+            if len(tolerance_fulfilled) > 0:
+                new_rank = min(new_rank, tolerance_fulfilled[0] + 1)
+
+        # Update the basis and the singular triplets
+        basis = list()
+        for n in range(new_rank):
+            basis_coefficients = create_online_vector(len(extended_basis))
+            basis_coefficients[:] = left_singular_vectors[:, n]
+            basis.append(extended_basis * basis_coefficients)
+        self._basis.clear()
+        self._basis.extend(basis)
+        self._singular_values = singular_values[:new_rank]
+        extended_right_singular_vectors = np.zeros((len(self) + 1, rank + 1), dtype=petsc4py.PETSc.ScalarType)
+        extended_right_singular_vectors[:-1, :rank] = self._right_singular_vectors
+        extended_right_singular_vectors[-1, rank] = 1.0
+        self._right_singular_vectors = extended_right_singular_vectors @ right_singular_vectors_h[:new_rank].conj().T
+
+    def extend(self: typing_extensions.Self, snapshots: typing.Iterable[Function]) -> None:
+        """
+        Update the decomposition with an iterable of new snapshots.
+
+        Parameters
+        ----------
+        snapshots
+            Snapshots to be added to the decomposition.
+        """
+        for snapshot in snapshots:
+            self.append(snapshot)
+
+    def decomposition(self: typing_extensions.Self, normalize: bool = True) -> tuple[  # type: ignore[no-any-unimported]
+        np.typing.NDArray[petsc4py.PETSc.RealType], FunctionsList[Function], list[petsc4py.PETSc.Vec]
+    ]:
+        """
+        Return the current proper orthogonal decomposition.
+
+        Parameters
+        ----------
+        normalize
+            If true (default), the modes are scaled to unit norm.
+
+        Returns
+        -------
+        :
+            A tuple containing:
+                1. Eigenvalues of the correlation matrix associated to the retained modes, largest first.
+                   Unlike the batch proper orthogonal decomposition, the eigenvalues associated to discarded
+                   modes are not returned.
+                2. Retained modes from the snapshots.
+                3. Eigenvectors of the correlation matrix associated to the retained modes.
+        """
+        rank = len(self._basis)
+
+        modes = self._basis.duplicate()
+        for n in range(rank):
+            mode_n = self._copy(self._basis[n])
+            if not normalize:
+                self._scale(mode_n, self._singular_values[n])
+            modes.append(mode_n)
+
+        eigenvectors = list()
+        for n in range(rank):
+            eigenvector_n = create_online_vector(len(self))
+            eigenvector_n[:] = self._right_singular_vectors[:, n]
+            eigenvectors.append(eigenvector_n)
+
+        return self._singular_values**2, modes, eigenvectors
+
+    @abc.abstractmethod
+    def _copy(self: typing_extensions.Self, function: Function) -> Function:
+        """
+        Copy a function of the basis.
+
+        Parameters
+        ----------
+        function
+            Function to be copied.
+
+        Returns
+        -------
+        :
+            A new function storing the same values as the provided one.
+        """
+        pass  # pragma: no cover
+
+    @abc.abstractmethod
+    def _scale(  # type: ignore[no-any-unimported]
+        self: typing_extensions.Self, function: Function, factor: petsc4py.PETSc.RealType
+    ) -> None:
+        """
+        Scale a function in place.
+
+        Parameters
+        ----------
+        function
+            Function to be scaled.
+        factor
+            Scaling factor.
+        """
+        pass  # pragma: no cover
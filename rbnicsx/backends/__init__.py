@@ -16,7 +16,7 @@ from rbnicsx.backends.projection import (
     FormArgumentsReplacer, linear_form_action, project_matrix, project_matrix_block, project_vector,
     project_vector_block)
 from rbnicsx.backends.proper_orthogonal_decomposition import (
-    proper_orthogonal_decomposition, proper_orthogonal_decomposition_block)
+    IncrementalProperOrthogonalDecomposition, proper_orthogonal_decomposition, proper_orthogonal_decomposition_block)
 from rbnicsx.backends.symbolic_parameters import SymbolicParameters
 from rbnicsx.backends.tensors_array import TensorsArray
 from rbnicsx.backends.tensors_list import TensorsList
@@ -104,8 +104,9 @@ class FunctionsList(FunctionsListBase[dolfinx.fem.Function]):
             output = self._list[0].copy()
             with output.x.petsc_vec.localForm() as output_local:
                 output_local.set(0.0)
-            for i in range(other.size):
-                output.x.petsc_vec.axpy(other[i], self._list[i].x.petsc_vec)
+            # Accumulate all contributions at once, rather than with one axpy per function
+            output.x.petsc_vec.maxpy(
+                other.getArray(readonly=True), [function.x.petsc_vec for function in self._list[:other.size]])
             output.x.petsc_vec.ghostUpdate(
                 addv=petsc4py.PETSc.InsertMode.INSERT, mode=petsc4py.PETSc.ScatterMode.FORWARD)
             return output
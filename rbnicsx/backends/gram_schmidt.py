@@ -37,11 +37,17 @@ def gram_schmidt(  # type: ignore[no-any-unimported]
     """
     orthonormalized = new_function.copy()
     orthonormalized.x.array[:] = new_function.x.array
-    for function_n in functions_list:
-        orthonormalized.x.petsc_vec.axpy(
-            - compute_inner_product(function_n)(orthonormalized), function_n.x.petsc_vec)
-    orthonormalized.x.petsc_vec.ghostUpdate(
-        addv=petsc4py.PETSc.InsertMode.INSERT, mode=petsc4py.PETSc.ScatterMode.FORWARD)
+    if len(functions_list) > 0:
+        # Classical Gram-Schmidt with reorthogonalization
+        functions_vecs = [function_n.x.petsc_vec for function_n in functions_list]
+        for _ in range(2):
+            compute_inner_product_partial = compute_inner_product(orthonormalized)
+            projection = np.array(
+                [np.conj(compute_inner_product_partial(function_n)) for function_n in functions_list],
+                dtype=petsc4py.PETSc.ScalarType)
+            orthonormalized.x.petsc_vec.maxpy(- projection, functions_vecs)
+            orthonormalized.x.petsc_vec.ghostUpdate(
+                addv=petsc4py.PETSc.InsertMode.INSERT, mode=petsc4py.PETSc.ScatterMode.FORWARD)
     norm = np.sqrt(compute_inner_product(orthonormalized)(orthonormalized))
     if norm != 0.0:
         with orthonormalized.x.petsc_vec.localForm() as orthonormalized_local:
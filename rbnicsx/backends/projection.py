@@ -8,6 +8,7 @@
 import typing
 
 import dolfinx.fem
+import dolfinx.fem.petsc
 import mpi4py.MPI
 import numpy as np
 import petsc4py.PETSc
@@ -423,7 +424,7 @@ def block_linear_form_action(  # type: ignore[no-any-unimported]
 
 
 def bilinear_form_action(  # type: ignore[no-any-unimported]
-    a: ufl.Form, part: typing.Optional[str] = None
+    a: ufl.Form, part: typing.Optional[str] = None, assemble_matrix: bool = False
 ) -> typing.Callable[[dolfinx.fem.Function], typing.Callable[[dolfinx.fem.Function], petsc4py.PETSc.ScalarType]]:
     """
     Return a callable that represents the action of a bilinear form on a pair of functions.
@@ -435,13 +436,30 @@ def bilinear_form_action(  # type: ignore[no-any-unimported]
     part
         Optional part (real or complex) to extract from the action result.
         If not provided, no postprocessing of the result will be carried out.
+    assemble_matrix
+        If true, the form is assembled as a matrix when the callable is generated, and its action is computed
+        by a matrix-vector product. Later changes to the mesh geometry or to coefficients and constants of the form
+        are then not taken into account, and a new callable must be generated after any such change.
+        If false (default), the action is assembled each time the callable is evaluated on a trial function.
 
     Returns
     -------
     :
         A callable that represents the action of a on a pair of functions.
     """
-    a_replacement_cpp = FormArgumentsReplacer(a, test=True, trial=True)
+    # The action of a on a trial function is computed once as a vector, so that the evaluation on each
+    # test function reduces to a dot product
+    a_matrix: typing.Optional[petsc4py.PETSc.Mat] = None  # type: ignore[no-any-unimported]
+    a_action_replacement_cpp: typing.Optional[FormArgumentsReplacer] = None
+    if assemble_matrix:
+        a_matrix = dolfinx.fem.petsc.assemble_matrix(dolfinx.fem.form(a))
+        a_matrix.assemble()
+        a_action = a_matrix.createVecLeft()
+        trial_replacement = dolfinx.fem.Function(a.arguments()[1].ufl_function_space())
+    else:
+        a_action_replacement_cpp = FormArgumentsReplacer(a, trial=True)
+        a_action = dolfinx.fem.petsc.create_vector(a_action_replacement_cpp.form_cpp)
+    test_replacement = dolfinx.fem.Function(a.arguments()[0].ufl_function_space())
 
     def _trial_action(fun_1: dolfinx.fem.Function) -> typing.Callable[  # type: ignore[no-any-unimported]
             [dolfinx.fem.Function], petsc4py.PETSc.ScalarType]:
@@ -458,7 +476,19 @@ def bilinear_form_action(  # type: ignore[no-any-unimported]
         :
             A callable that represents action of a bilinear form on a function, to be replaced to the trial function.
         """
-        a_replacement_cpp.replace(trial=fun_1)
+        if a_matrix is not None:
+            if not isinstance(fun_1, dolfinx.fem.Function):
+                assert isinstance(fun_1, ufl.core.expr.Expr)
+                FormArgumentsReplacer._interpolate_ufl_expression(fun_1, trial_replacement)
+                fun_1 = trial_replacement
+            a_matrix.mult(fun_1.x.petsc_vec, a_action)
+        else:
+            assert a_action_replacement_cpp is not None
+            a_action_replacement_cpp.replace(trial=fun_1)
+            with a_action.localForm() as a_action_local:
+                a_action_local.set(0.0)
+            dolfinx.fem.petsc.assemble_vector(a_action, a_action_replacement_cpp.form_cpp)
+            a_action.ghostUpdate(addv=petsc4py.PETSc.InsertMode.ADD, mode=petsc4py.PETSc.ScatterMode.REVERSE)
 
         def _test_action(fun_0: dolfinx.fem.Function) -> typing.Union[  # type: ignore[no-any-unimported]
                 petsc4py.PETSc.ScalarType, petsc4py.PETSc.RealType]:
@@ -475,11 +505,11 @@ def bilinear_form_action(  # type: ignore[no-any-unimported]
             :
                 Evaluation of the action of a on the provided pair of functions.
             """
-            a_replacement_cpp.replace(test=fun_0)
-            return _extract_part(
-                a_replacement_cpp.comm.allreduce(
-                    dolfinx.fem.assemble_scalar(a_replacement_cpp.form_cpp), op=mpi4py.MPI.SUM),
-                part)
+            if not isinstance(fun_0, dolfinx.fem.Function):
+                assert isinstance(fun_0, ufl.core.expr.Expr)
+                FormArgumentsReplacer._interpolate_ufl_expression(fun_0, test_replacement)
+                fun_0 = test_replacement
+            return _extract_part(a_action.dot(fun_0.x.petsc_vec), part)
 
         return _test_action
 
@@ -487,7 +517,7 @@ def bilinear_form_action(  # type: ignore[no-any-unimported]
 
 
 def block_diagonal_bilinear_form_action(  # type: ignore[no-any-unimported]
-    a: typing.Sequence[ufl.Form], part: typing.Optional[str] = None
+    a: typing.Sequence[ufl.Form], part: typing.Optional[str] = None, assemble_matrix: bool = False
 ) -> typing.Sequence[
         typing.Callable[[dolfinx.fem.Function], typing.Callable[[dolfinx.fem.Function], petsc4py.PETSc.ScalarType]]
 ]:
@@ -501,18 +531,21 @@ def block_diagonal_bilinear_form_action(  # type: ignore[no-any-unimported]
     part
         Optional part (real or complex) to extract from the action result.
         If not provided, no postprocessing of the result will be carried out.
+    assemble_matrix
+        If true, each block is assembled as a matrix when the callables are generated.
+        See rbnicsx.backends.bilinear_form_action for further details.
 
     Returns
     -------
     :
         A list of callables that represents the action of a on a pair of functions.
     """
-    return [bilinear_form_action(a_ii) for a_ii in a]
+    return [bilinear_form_action(a_ii, assemble_matrix=assemble_matrix) for a_ii in a]
 
 
 def block_bilinear_form_action(  # type: ignore[no-any-unimported]
     a: typing.Sequence[typing.Sequence[ufl.Form]],
-    part: typing.Optional[str] = None
+    part: typing.Optional[str] = None, assemble_matrix: bool = False
 ) -> typing.Sequence[typing.Sequence[
         typing.Callable[[dolfinx.fem.Function], typing.Callable[[dolfinx.fem.Function], petsc4py.PETSc.ScalarType]]]
 ]:
@@ -526,13 +559,16 @@ def block_bilinear_form_action(  # type: ignore[no-any-unimported]
     part
         Optional part (real or complex) to extract from the action result.
         If not provided, no postprocessing of the result will be carried out.
+    assemble_matrix
+        If true, each block is assembled as a matrix when the callables are generated.
+        See rbnicsx.backends.bilinear_form_action for further details.
 
     Returns
     -------
     :
         A matrix of callables that represents the action of a on a pair of functions.
     """
-    return [[bilinear_form_action(a_ij) for a_ij in a_i] for a_i in a]
+    return [[bilinear_form_action(a_ij, assemble_matrix=assemble_matrix) for a_ij in a_i] for a_i in a]
 
 
 def _extract_part(  # type: ignore[no-any-unimported]
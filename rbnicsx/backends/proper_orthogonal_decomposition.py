@@ -5,6 +5,7 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 """Backend to compute the proper orthogonal decomposition of dolfinx objects."""
 
+import sys
 import typing
 
 import dolfinx.fem
@@ -14,12 +15,18 @@ import petsc4py.PETSc
 import plum
 
 from rbnicsx._backends.proper_orthogonal_decomposition import (
+    IncrementalProperOrthogonalDecomposition as IncrementalProperOrthogonalDecompositionBase,
     proper_orthogonal_decomposition_functions as proper_orthogonal_decomposition_functions_super,
     proper_orthogonal_decomposition_functions_block as proper_orthogonal_decomposition_functions_block_super,
     proper_orthogonal_decomposition_tensors as proper_orthogonal_decomposition_tensors_super, real_zero)
 from rbnicsx.backends.functions_list import FunctionsList
 from rbnicsx.backends.tensors_list import TensorsList
 
+if sys.version_info >= (3, 11):  # pragma: no cover
+    import typing as typing_extensions
+else:  # pragma: no cover
+    import typing_extensions
+
 # We could have used functools.singledispatch rather than plum, but since rbnicsx.online.projection
 # introduces a dependency on plum we also use it here for its better handling in combining docstrings
 # and its easier integration with mypy.
@@ -30,7 +37,8 @@ def proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
     functions_list: FunctionsList,
     compute_inner_product: typing.Callable[
         [dolfinx.fem.Function], typing.Callable[[dolfinx.fem.Function], petsc4py.PETSc.RealType]],
-    N: int = -1, tol: petsc4py.PETSc.RealType = real_zero, normalize: bool = True
+    N: int = -1, tol: petsc4py.PETSc.RealType = real_zero, normalize: bool = True,
+    reuse_correlation_matrix: bool = False
 ) -> tuple[
     np.typing.NDArray[petsc4py.PETSc.RealType], FunctionsList, list[petsc4py.PETSc.Vec]
 ]:
@@ -51,6 +59,14 @@ def proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
         Tolerance on the retained energy. If not provided, it will be set to zero.
     normalize
         If true (default), the modes are scaled to unit norm.
+    reuse_correlation_matrix
+        If true, the correlation matrix is stored on the FunctionsList, so that a later call with the same
+        callable compute_inner_product only computes the inner products involving snapshots appended in the
+        meantime, e.g. by a greedy algorithm. This is only correct if, between such calls, the inner product
+        has not changed (e.g. because of an update to a constant or a coefficient of its form) and the snapshots
+        already stored in the list have not been modified in place (e.g. by interpolation). Replacing or removing
+        snapshots discards the stored correlation matrix. Note that each call to bilinear_form_action returns
+        a new callable. If false (default), the correlation matrix is computed from scratch.
 
     Returns
     -------
@@ -63,7 +79,7 @@ def proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
                either the maximum number N is reached or the tolerance on the retained energy is fulfilled.
     """
     return proper_orthogonal_decomposition_functions_super(  # type: ignore[return-value]
-        functions_list, compute_inner_product, _scale_function, N, tol, normalize)
+        functions_list, compute_inner_product, _scale_function, N, tol, normalize, reuse_correlation_matrix)
 
 
 @plum.overload
@@ -113,7 +129,7 @@ def proper_orthogonal_decomposition_block(  # type: ignore[no-any-unimported]
         typing.Callable[[dolfinx.fem.Function], typing.Callable[[dolfinx.fem.Function], petsc4py.PETSc.RealType]]],
     N: typing.Union[int, list[int]] = -1,
     tol: typing.Union[petsc4py.PETSc.RealType, list[petsc4py.PETSc.RealType]] = real_zero,
-    normalize: bool = True
+    normalize: bool = True, distribute_eigenvalue_problems: bool = False, reuse_correlation_matrix: bool = False
 ) -> tuple[
     list[np.typing.NDArray[petsc4py.PETSc.RealType]], list[FunctionsList],
     list[list[petsc4py.PETSc.Vec]]
@@ -142,6 +158,16 @@ def proper_orthogonal_decomposition_block(  # type: ignore[no-any-unimported]
         If not provided, it will be set to zero.
     normalize
         If true (default), the modes are scaled to unit norm.
+    distribute_eigenvalue_problems
+        If true, the eigenvalue problem of each block is solved by a single process, assigning blocks to processes
+        in a round-robin fashion, and its solution is then broadcast to the other processes. This only pays off
+        when there are many blocks with many snapshots, since assembling the correlation matrices usually costs
+        far more than solving the eigenvalue problems. If false (default), every process solves all eigenvalue
+        problems on its own.
+    reuse_correlation_matrix
+        If true, the correlation matrix of each block is stored on the corresponding FunctionsList, as described
+        in rbnicsx.backends.proper_orthogonal_decomposition. If false (default), the correlation matrices are
+        computed from scratch.
 
     Returns
     -------
@@ -157,12 +183,58 @@ def proper_orthogonal_decomposition_block(  # type: ignore[no-any-unimported]
                The outer list collects the eigenvectors of different blocks.
     """
     return proper_orthogonal_decomposition_functions_block_super(  # type: ignore[return-value]
-        functions_lists, compute_inner_products, _scale_function, N, tol, normalize)
+        functions_lists, compute_inner_products, _scale_function, N, tol, normalize,
+        distribute_eigenvalue_problems, reuse_correlation_matrix)
+
+
+@typing.final
+class IncrementalProperOrthogonalDecomposition(IncrementalProperOrthogonalDecompositionBase[dolfinx.fem.Function]):
+    """
+    A class to compute the proper orthogonal decomposition of dolfinx Functions which are collected one at a time.
+
+    Only the eigenvalues associated to the retained modes are available, since the remaining ones are discarded
+    after each update. This differs from rbnicsx.backends.proper_orthogonal_decomposition, which returns all
+    eigenvalues of the correlation matrix.
+
+    Parameters
+    ----------
+    function_space
+        Common finite element space of any snapshot that will be added to the decomposition.
+    compute_inner_product
+        A callable x(u)(v) to compute the action of the inner product on the trial function u and test function v.
+        The resulting modes will be orthonormal w.r.t. this inner product.
+        Use rbnicsx.backends.bilinear_form_action to generate the callable x from a UFL form.
+    N
+        Maximum number of modes to be retained after each update. If not provided, the number of modes
+        will only be limited by the number of linearly independent snapshots.
+    tol
+        Tolerance on the retained energy. If not provided, it will be set to zero.
+    """
+
+    def __init__(  # type: ignore[no-any-unimported]
+        self: typing_extensions.Self, function_space: dolfinx.fem.FunctionSpace,
+        compute_inner_product: typing.Callable[
+            [dolfinx.fem.Function], typing.Callable[[dolfinx.fem.Function], petsc4py.PETSc.RealType]],
+        N: int = -1, tol: petsc4py.PETSc.RealType = real_zero
+    ) -> None:
+        super().__init__(FunctionsList(function_space), compute_inner_product, N, tol)
+
+    def _copy(  # type: ignore[no-any-unimported]
+        self: typing_extensions.Self, function: dolfinx.fem.Function
+    ) -> dolfinx.fem.Function:
+        """Copy a dolfinx Function of the basis."""
+        return function.copy()
+
+    def _scale(  # type: ignore[no-any-unimported]
+        self: typing_extensions.Self, function: dolfinx.fem.Function, factor: petsc4py.PETSc.RealType
+    ) -> None:
+        """Scale a dolfinx Function in place."""
+        _scale_function(function, factor)
 
 
 def _scale_function(  # type: ignore[no-any-unimported]
     function: dolfinx.fem.Function, factor: petsc4py.PETSc.RealType
 ) -> None:
     """Scale a dolfinx Function."""
-    with function.x.petsc_vec.localForm() as function_local:
-        function_local *= factor
+    # Owned and ghost entries are scaled at once, without any communication
+    function.x.array[:] *= factor
@@ -34,9 +34,14 @@ def gram_schmidt(  # type: ignore[no-any-unimported]
     compute_inner_product = matrix_action(inner_product)
 
     orthonormalized = new_function.copy()
-    for function_n in functions_list:
-        orthonormalized.axpy(
-            - compute_inner_product(function_n)(orthonormalized), function_n)
+    if len(functions_list) > 0:
+        # Classical Gram-Schmidt with reorthogonalization
+        for _ in range(2):
+            compute_inner_product_partial = compute_inner_product(orthonormalized)
+            projection = np.array(
+                [np.conj(compute_inner_product_partial(function_n)) for function_n in functions_list],
+                dtype=petsc4py.PETSc.ScalarType)
+            orthonormalized.maxpy(- projection, list(functions_list))
     norm = np.sqrt(compute_inner_product(orthonormalized)(orthonormalized))
     if norm != 0.0:
         orthonormalized *= 1.0 / norm
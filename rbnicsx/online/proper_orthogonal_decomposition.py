@@ -35,6 +35,8 @@ def proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
     """
     Compute the proper orthogonal decomposition of a set of online snapshots.
 
+    The correlation matrix is computed from scratch at each call.
+
     Parameters
     ----------
     functions_list
@@ -118,6 +120,8 @@ def proper_orthogonal_decomposition_block(  # type: ignore[no-any-unimported]
     """
     Compute the proper orthogonal decomposition of a set of online snapshots, each made of several blocks.
 
+    The correlation matrices are computed from scratch at each call.
+
     Parameters
     ----------
     functions_lists
@@ -13,6 +13,7 @@ import mpi4py.MPI
 import nbvalx.tempfile
 import numpy as np
 import pytest
+import ufl
 
 import rbnicsx.backends
 import rbnicsx.online
@@ -112,6 +113,20 @@ def test_backends_functions_list_setitem(functions_list: rbnicsx.backends.Functi
     assert np.allclose(functions_list[1].x.array, 2)
 
 
+def test_backends_functions_list_correlation_matrix(functions_list: rbnicsx.backends.FunctionsList) -> None:
+    """Check rbnicsx.backends.FunctionsList.get_correlation_matrix and store_correlation_matrix."""
+    V = functions_list.function_space
+    u = ufl.TrialFunction(V)
+    v = ufl.TestFunction(V)
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(ufl.inner(u, v) * ufl.dx)
+    assert functions_list.get_correlation_matrix(compute_inner_product) is None
+    correlation_matrix = np.eye(2)
+    functions_list.store_correlation_matrix(compute_inner_product, correlation_matrix)
+    assert functions_list.get_correlation_matrix(compute_inner_product) is correlation_matrix
+    functions_list[0] = functions_list[1]
+    assert functions_list.get_correlation_matrix(compute_inner_product) is None
+
+
 def test_backends_functions_list_save_load(functions_list: rbnicsx.backends.FunctionsList) -> None:
     """Check I/O for a rbnicsx.backends.FunctionsList."""
     with nbvalx.tempfile.TemporaryDirectory(functions_list.comm) as tempdir:
@@ -94,6 +94,23 @@ def test_backends_gram_schmidt_zero(  # type: ignore[no-any-unimported]
     assert len(functions_list) == 0
 
 
+def test_backends_gram_schmidt_correlated(  # type: ignore[no-any-unimported]
+    mesh: dolfinx.mesh.Mesh, inner_product: ufl.Form
+) -> None:
+    """Check that rbnicsx.backends.gram_schmidt preserves orthonormality with nearly parallel functions."""
+    V = dolfinx.fem.functionspace(mesh, ("Lagrange", 1))
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(inner_product)
+    functions_list = rbnicsx.backends.FunctionsList(V)
+    for (a, b) in [(0, 0), (0, 1), (1, 1), (0, 2), (2, 0)]:
+        function = dolfinx.fem.Function(V)
+        function.interpolate(lambda x: x[0] + 1e-6 * x[0]**a * x[1]**b)
+        rbnicsx.backends.gram_schmidt(functions_list, function, compute_inner_product)
+    assert len(functions_list) == 5
+    for (m, function_m) in enumerate(functions_list):
+        for (n, function_n) in enumerate(functions_list):
+            assert np.isclose(compute_inner_product(function_m)(function_n), 1 if m == n else 0)
+
+
 def test_backends_gram_schmidt_block(  # type: ignore[no-any-unimported]
     functions: list[dolfinx.fem.Function], inner_product: ufl.Form
 ) -> None:
@@ -136,6 +136,56 @@ def test_backends_projection_vector_block(functions_list: rbnicsx.backends.Funct
     assert np.allclose(online_vec2.array, online_vec.array)
 
 
+@pytest.mark.parametrize("assemble_matrix", [True, False])
+def test_backends_bilinear_form_action(
+    functions_list: rbnicsx.backends.FunctionsList, assemble_matrix: bool
+) -> None:
+    """Test the action of a bilinear form on functions and on UFL expressions."""
+    V = functions_list.function_space
+    u = ufl.TrialFunction(V)
+    v = ufl.TestFunction(V)
+    bilinear_form = ufl.inner(u, v) * ufl.dx
+
+    bilinear_form_action = rbnicsx.backends.bilinear_form_action(bilinear_form, assemble_matrix=assemble_matrix)
+    assert np.isclose(bilinear_form_action(functions_list[1])(functions_list[0]), 2)
+    assert np.isclose(bilinear_form_action(functions_list[1])(functions_list[2]), 6)
+    difference = functions_list[1] - functions_list[0]
+    assert np.isclose(bilinear_form_action(difference)(difference), 1)
+    assert np.isclose(bilinear_form_action(functions_list[1])(difference), 2)
+
+
+def test_backends_bilinear_form_action_constant(functions_list: rbnicsx.backends.FunctionsList) -> None:
+    """Test that the action of a bilinear form accounts for updates of the constants in the form."""
+    V = functions_list.function_space
+    u = ufl.TrialFunction(V)
+    v = ufl.TestFunction(V)
+    c = dolfinx.fem.Constant(V.mesh, petsc4py.PETSc.ScalarType(1))
+    bilinear_form = c * ufl.inner(u, v) * ufl.dx
+
+    bilinear_form_action = rbnicsx.backends.bilinear_form_action(bilinear_form)
+    assert np.isclose(bilinear_form_action(functions_list[1])(functions_list[0]), 2)
+    c.value = 3
+    assert np.isclose(bilinear_form_action(functions_list[1])(functions_list[0]), 6)
+
+
+@pytest.mark.parametrize("assemble_matrix", [True, False])
+def test_backends_bilinear_form_action_mesh_motion(
+    functions_list: rbnicsx.backends.FunctionsList, assemble_matrix: bool
+) -> None:
+    """Test that the action of a bilinear form accounts for mesh motion only if the matrix is not assembled."""
+    V = functions_list.function_space
+    u = ufl.TrialFunction(V)
+    v = ufl.TestFunction(V)
+    bilinear_form = ufl.inner(u, v) * ufl.dx
+
+    bilinear_form_action = rbnicsx.backends.bilinear_form_action(bilinear_form, assemble_matrix=assemble_matrix)
+    assert np.isclose(bilinear_form_action(functions_list[1])(functions_list[0]), 2)
+    V.mesh.geometry.x[:] *= 2
+    assert np.isclose(bilinear_form_action(functions_list[1])(functions_list[0]), 2 if assemble_matrix else 8)
+    assert np.isclose(rbnicsx.backends.bilinear_form_action(
+        bilinear_form, assemble_matrix=assemble_matrix)(functions_list[1])(functions_list[0]), 8)
+
+
 def test_backends_projection_matrix_galerkin(  # type: ignore[no-any-unimported]
     functions_list: rbnicsx.backends.FunctionsList,
     to_dense_matrix: typing.Callable[[petsc4py.PETSc.Mat], np.typing.NDArray[petsc4py.PETSc.ScalarType]]
@@ -150,6 +150,88 @@ def test_backends_proper_orthogonal_decomposition_functions_N_tol(  # type: igno
     assert len(eigenvectors) == 1
 
 
+def test_backends_proper_orthogonal_decomposition_functions_small_eigenvalue(  # type: ignore[no-any-unimported]
+    mesh: dolfinx.mesh.Mesh, inner_product: ufl.Form
+) -> None:
+    """
+    Check rbnicsx.backends.proper_orthogonal_decomposition for the case of dolfinx.fem.Function snapshots.
+
+    The case of normalized modes associated to an eigenvalue which is much smaller than the largest one
+    is tested here.
+    """
+    V = dolfinx.fem.functionspace(mesh, ("Lagrange", 1))
+    functions_list = rbnicsx.backends.FunctionsList(V)
+    for epsilon in (0.0, 1e-6):
+        function = dolfinx.fem.Function(V)
+        function.interpolate(lambda x: x[0] + epsilon * x[1])
+        functions_list.append(function)
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(inner_product)
+    eigenvalues, modes, _ = rbnicsx.backends.proper_orthogonal_decomposition(functions_list, compute_inner_product)
+    assert len(eigenvalues) == 2
+    assert eigenvalues[1] < 1e-10 * eigenvalues[0]
+    assert len(modes) == 2
+    for mode in modes:
+        assert np.isclose(compute_inner_product(mode)(mode), 1)
+
+
+def test_backends_proper_orthogonal_decomposition_functions_cache(  # type: ignore[no-any-unimported]
+    functions_list: rbnicsx.backends.FunctionsList, inner_product: ufl.Form
+) -> None:
+    """
+    Check rbnicsx.backends.proper_orthogonal_decomposition for the case of dolfinx.fem.Function snapshots.
+
+    The case of repeated calls on the same snapshots, which explicitly reuse the previously computed inner
+    products, is tested here.
+    """
+    bilinear_form_action = rbnicsx.backends.bilinear_form_action(inner_product)
+    trial_functions = list()
+
+    def compute_inner_product(  # type: ignore[no-any-unimported]
+        function: dolfinx.fem.Function
+    ) -> typing.Callable[[dolfinx.fem.Function], petsc4py.PETSc.ScalarType]:
+        trial_functions.append(function)
+        return bilinear_form_action(function)
+
+    snapshots = functions_list[:2]
+    eigenvalues, _, _ = rbnicsx.backends.proper_orthogonal_decomposition(
+        snapshots, compute_inner_product, normalize=False, reuse_correlation_matrix=True)
+    assert len(trial_functions) == 2
+    assert np.allclose(eigenvalues, [5, 0])
+    snapshots.extend(functions_list[2:])
+    eigenvalues, _, _ = rbnicsx.backends.proper_orthogonal_decomposition(
+        snapshots, compute_inner_product, normalize=False, reuse_correlation_matrix=True)
+    assert len(trial_functions) == 4
+    assert np.isclose(eigenvalues[0], 30)
+    assert np.allclose(eigenvalues[1:], 0)
+    snapshots[0] = functions_list[3]
+    eigenvalues, _, _ = rbnicsx.backends.proper_orthogonal_decomposition(
+        snapshots, compute_inner_product, normalize=False, reuse_correlation_matrix=True)
+    assert len(trial_functions) == 8
+    assert np.isclose(eigenvalues[0], 45)
+    assert np.allclose(eigenvalues[1:], 0)
+
+
+def test_backends_proper_orthogonal_decomposition_functions_constant(  # type: ignore[no-any-unimported]
+    functions_list: rbnicsx.backends.FunctionsList
+) -> None:
+    """
+    Check rbnicsx.backends.proper_orthogonal_decomposition for the case of dolfinx.fem.Function snapshots.
+
+    The case of repeated calls on the same snapshots, with an inner product which is updated in between,
+    is tested here.
+    """
+    V = functions_list.function_space
+    u = ufl.TrialFunction(V)
+    v = ufl.TestFunction(V)
+    c = dolfinx.fem.Constant(V.mesh, petsc4py.PETSc.ScalarType(1))
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(c * ufl.inner(u, v) * ufl.dx)
+    eigenvalues, _, _ = rbnicsx.backends.proper_orthogonal_decomposition(functions_list, compute_inner_product)
+    assert np.isclose(eigenvalues[0], 30)
+    c.value = 2
+    eigenvalues, _, _ = rbnicsx.backends.proper_orthogonal_decomposition(functions_list, compute_inner_product)
+    assert np.isclose(eigenvalues[0], 60)
+
+
 @pytest.mark.parametrize("normalize", [True, False])
 @pytest.mark.parametrize(
     "stopping_criterion_generator",
@@ -184,6 +266,42 @@ def test_backends_proper_orthogonal_decomposition_block(  # type: ignore[no-any-
         assert len(eigenvectors[component]) == 2
 
 
+@pytest.mark.parametrize("distribute_eigenvalue_problems", [True, False])
+def test_backends_proper_orthogonal_decomposition_block_distribute(  # type: ignore[no-any-unimported]
+    functions_list: rbnicsx.backends.FunctionsList, inner_product: ufl.Form, distribute_eigenvalue_problems: bool
+) -> None:
+    """Check rbnicsx.backends.proper_orthogonal_decomposition_block with and without distribution."""
+    compute_inner_product = rbnicsx.backends.block_diagonal_bilinear_form_action([inner_product, 2 * inner_product])
+    eigenvalues, modes, eigenvectors = rbnicsx.backends.proper_orthogonal_decomposition_block(
+        [functions_list[:2], functions_list[2:4]], compute_inner_product, N=[1, 2],
+        distribute_eigenvalue_problems=distribute_eigenvalue_problems)
+    assert len(eigenvalues) == 2
+    for (component, eigenvalue_factor) in enumerate([1, 10]):
+        assert len(eigenvalues[component]) == 2
+        assert np.isclose(eigenvalues[component][0], 5 * eigenvalue_factor)
+        assert np.isclose(eigenvalues[component][1], 0)
+    assert [len(modes_) for modes_ in modes] == [1, 2]
+    for (component, compute_inner_product_) in enumerate(compute_inner_product):
+        assert np.isclose(compute_inner_product_(modes[component][0])(modes[component][0]), 1)
+    assert [len(eigenvectors_) for eigenvectors_ in eigenvectors] == [1, 2]
+    for (eigenvectors_, snapshots_values) in zip(eigenvectors, [np.array([1, 2]), np.array([3, 4])]):
+        assert np.allclose(np.abs(eigenvectors_[0].array), snapshots_values / np.linalg.norm(snapshots_values))
+
+
+@pytest.mark.parametrize("distribute_eigenvalue_problems", [True, False])
+@pytest.mark.parametrize("N", [0, [2, -5]])
+def test_backends_proper_orthogonal_decomposition_block_wrong_N(  # type: ignore[no-any-unimported]
+    functions_list: rbnicsx.backends.FunctionsList, inner_product: ufl.Form,
+    distribute_eigenvalue_problems: bool, N: typing.Union[int, list[int]]
+) -> None:
+    """Check rbnicsx.backends.proper_orthogonal_decomposition_block raises on every process with a wrong N."""
+    compute_inner_product = rbnicsx.backends.block_diagonal_bilinear_form_action([inner_product, 2 * inner_product])
+    with pytest.raises(AssertionError):
+        rbnicsx.backends.proper_orthogonal_decomposition_block(
+            [functions_list[:2], functions_list[2:4]], compute_inner_product, N=N,
+            distribute_eigenvalue_problems=distribute_eigenvalue_problems)
+
+
 @pytest.mark.parametrize("normalize", [True, False])
 def test_backends_proper_orthogonal_decomposition_vectors(
     tensors_list_vec: rbnicsx.backends.TensorsList, normalize: bool
@@ -236,6 +354,108 @@ def test_backends_proper_orthogonal_decomposition_zero(  # type: ignore[no-any-u
     assert len(eigenvectors) == 2
 
 
+@pytest.mark.parametrize("normalize", [True, False])
+def test_backends_incremental_proper_orthogonal_decomposition(  # type: ignore[no-any-unimported]
+    functions_list: rbnicsx.backends.FunctionsList, inner_product: ufl.Form, normalize: bool
+) -> None:
+    """Check rbnicsx.backends.IncrementalProperOrthogonalDecomposition with linearly dependent snapshots."""
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(inner_product)
+    incremental_proper_orthogonal_decomposition = rbnicsx.backends.IncrementalProperOrthogonalDecomposition(
+        functions_list.function_space, compute_inner_product)
+    incremental_proper_orthogonal_decomposition.extend(functions_list)
+    assert len(incremental_proper_orthogonal_decomposition) == 4
+    eigenvalues, modes, eigenvectors = incremental_proper_orthogonal_decomposition.decomposition(normalize)
+    assert len(eigenvalues) == 1
+    assert np.isclose(eigenvalues[0], 30)
+    assert len(modes) == 1
+    assert np.isclose(compute_inner_product(modes[0])(modes[0]), 1 if normalize else 30)
+    if normalize:
+        assert np.allclose(np.abs(modes[0].x.array), 1)
+    assert len(eigenvectors) == 1
+    assert np.allclose(np.abs(eigenvectors[0].array), np.arange(1, 5) / np.sqrt(30))
+
+
+def test_backends_incremental_proper_orthogonal_decomposition_independent(  # type: ignore[no-any-unimported]
+    mesh: dolfinx.mesh.Mesh, inner_product: ufl.Form
+) -> None:
+    """Check rbnicsx.backends.IncrementalProperOrthogonalDecomposition against the batch decomposition."""
+    V = dolfinx.fem.functionspace(mesh, ("Lagrange", 1))
+    functions_list = rbnicsx.backends.FunctionsList(V)
+    for i in range(3):
+        function = dolfinx.fem.Function(V)
+        function.interpolate(lambda x: x[0]**i)
+        functions_list.append(function)
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(inner_product)
+    eigenvalues, modes, _ = rbnicsx.backends.proper_orthogonal_decomposition(
+        functions_list, compute_inner_product)
+    incremental_proper_orthogonal_decomposition = rbnicsx.backends.IncrementalProperOrthogonalDecomposition(
+        V, compute_inner_product)
+    incremental_proper_orthogonal_decomposition.extend(functions_list)
+    incremental_eigenvalues, incremental_modes, _ = incremental_proper_orthogonal_decomposition.decomposition()
+    assert len(incremental_eigenvalues) == 3
+    assert np.allclose(incremental_eigenvalues, eigenvalues)
+    assert len(incremental_modes) == 3
+    for (m, mode_m) in enumerate(incremental_modes):
+        for (n, mode_n) in enumerate(incremental_modes):
+            assert np.isclose(compute_inner_product(mode_m)(mode_n), 1 if m == n else 0)
+    assert np.allclose(np.abs(incremental_modes[0].x.array), np.abs(modes[0].x.array))
+
+
+def test_backends_incremental_proper_orthogonal_decomposition_truncated(  # type: ignore[no-any-unimported]
+    mesh: dolfinx.mesh.Mesh, inner_product: ufl.Form
+) -> None:
+    """
+    Check rbnicsx.backends.IncrementalProperOrthogonalDecomposition against the batch decomposition.
+
+    The case of a stream which is much longer than N is tested here, so that the decomposition is truncated
+    after most updates and the retained modes are only an approximation of the batch ones.
+    """
+    V = dolfinx.fem.functionspace(mesh, ("Lagrange", 1))
+    functions_list = rbnicsx.backends.FunctionsList(V)
+    for mu in np.linspace(0, 1, 20):
+        function = dolfinx.fem.Function(V)
+        function.interpolate(lambda x: 1 / (1 + mu * (x[0] + 2 * x[1])))
+        functions_list.append(function)
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(inner_product)
+    eigenvalues, modes, _ = rbnicsx.backends.proper_orthogonal_decomposition(
+        functions_list, compute_inner_product, N=3)
+    incremental_proper_orthogonal_decomposition = rbnicsx.backends.IncrementalProperOrthogonalDecomposition(
+        V, compute_inner_product, N=3)
+    incremental_proper_orthogonal_decomposition.extend(functions_list)
+    assert len(incremental_proper_orthogonal_decomposition) == 20
+    incremental_eigenvalues, incremental_modes, incremental_eigenvectors = (
+        incremental_proper_orthogonal_decomposition.decomposition())
+    assert len(incremental_eigenvalues) == 3
+    assert eigenvalues[3] > 1e-10 * eigenvalues[0]
+    assert np.allclose(incremental_eigenvalues, eigenvalues[:3], rtol=0, atol=1e-6 * eigenvalues[0])
+    assert len(incremental_modes) == 3
+    for (m, mode_m) in enumerate(incremental_modes):
+        for (n, mode_n) in enumerate(incremental_modes):
+            assert np.isclose(compute_inner_product(mode_m)(mode_n), 1 if m == n else 0)
+        assert np.isclose(abs(compute_inner_product(mode_m)(modes[m])), 1, rtol=0, atol=1e-6)
+    assert len(incremental_eigenvectors) == 3
+    assert all(incremental_eigenvector.size == 20 for incremental_eigenvector in incremental_eigenvectors)
+
+
+def test_backends_incremental_proper_orthogonal_decomposition_correlated(  # type: ignore[no-any-unimported]
+    mesh: dolfinx.mesh.Mesh, inner_product: ufl.Form
+) -> None:
+    """Check that rbnicsx.backends.IncrementalProperOrthogonalDecomposition preserves orthonormality."""
+    V = dolfinx.fem.functionspace(mesh, ("Lagrange", 1))
+    compute_inner_product = rbnicsx.backends.bilinear_form_action(inner_product)
+    incremental_proper_orthogonal_decomposition = rbnicsx.backends.IncrementalProperOrthogonalDecomposition(
+        V, compute_inner_product)
+    for k in range(40):
+        function = dolfinx.fem.Function(V)
+        function.interpolate(lambda x: x[0] + 1e-6 * k * x[1])
+        incremental_proper_orthogonal_decomposition.append(function)
+    _, modes, _ = incremental_proper_orthogonal_decomposition.decomposition()
+    assert len(modes) == 2
+    for (m, mode_m) in enumerate(modes):
+        for (n, mode_n) in enumerate(modes):
+            assert np.isclose(compute_inner_product(mode_m)(mode_n), 1 if m == n else 0)
+
+
 def test_backends_proper_orthogonal_decomposition_wrong_iterable() -> None:
     """Check rbnicsx.backends.proper_orthogonal_decomposition raises when providing a plain list."""
     with pytest.raises(plum.NotFoundLookupError) as excinfo:
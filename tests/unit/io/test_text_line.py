@@ -5,20 +5,18 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 """Tests for rbnicsx.io.text_line module."""
 
+import re
+
+import pytest
+
 import rbnicsx.io
 
 
-def test_text_line() -> None:
+@pytest.mark.parametrize("fill", ["#", "*"])
+def test_text_line(fill: str) -> None:
     """Unit test for TextLine.__str__."""
     greet = "Hello, World!"
-    fill = "#"
     text_line = rbnicsx.io.TextLine(greet, fill=fill)
-    text_line_str = str(text_line)
-    text_line_len = len(text_line_str)
-    first_space = text_line_str.find(" ")
-    assert first_space >= 0
-    last_space = text_line_str.rfind(" ")
-    assert first_space >= 0
-    assert text_line_str[:first_space] == fill * first_space
-    assert text_line_str[last_space + 1:] == fill * (text_line_len - last_space - 1)
-    assert text_line_str[first_space + 1:last_space] == greet
+    text_line_match = re.fullmatch(f"{re.escape(fill)}* (.+) {re.escape(fill)}*", str(text_line))
+    assert text_line_match is not None
+    assert text_line_match.group(1) == greet